@@ -1,5 +1,6 @@
 from adminsortable2.admin import SortableAdminBase, SortableInlineAdminMixin
 from django.contrib import admin
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
 from django.db import connection, transaction
 from django.db.models import Q, TextField
@@ -293,6 +294,9 @@ class ContestAdmin(NoBatchDeleteMixin, SortableAdminBase, VersionAdmin):
             Profile.objects.update(rating=None)
             for contest in Contest.objects.filter(is_rated=True, end_time__lte=timezone.now()).order_by('end_time'):
                 rate_contest(contest)
+        # Every rating was rewritten behind the ORM's back; invalidate all
+        # cached profiles once the rebuild commits.
+        cache.delete_many(['profile:%d' % uid for uid in Profile.objects.values_list('user_id', flat=True)])
         return HttpResponseRedirect(reverse('admin:judge_contest_changelist'))
 
     @method_decorator(require_POST)
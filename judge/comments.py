@@ -60,8 +60,12 @@ class CommentedDetailView(TemplateResponseMixin, SingleObjectMixin, View):
         return self.comment_page
 
     def is_comment_locked(self):
-        return (CommentLock.objects.filter(page=self.get_comment_page()).exists() and
-                not self.request.user.has_perm('judge.override_comment_lock'))
+        # post() checks this before saving and get_context_data() checks it
+        # again when re-rendering the form, so remember the answer.
+        if not hasattr(self, '_comment_locked'):
+            self._comment_locked = (CommentLock.objects.filter(page=self.get_comment_page()).exists() and
+                                    not self.request.user.has_perm('judge.override_comment_lock'))
+        return self._comment_locked
 
     @method_decorator(login_required)
     def post(self, request, *args, **kwargs):
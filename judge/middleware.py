@@ -37,12 +37,27 @@ class ShortCircuitMiddleware:
 
 
 class DMOJLoginMiddleware(object):
+    profile_cache_timeout = 300
+
     def __init__(self, get_response):
         self.get_response = get_response
 
+    @classmethod
+    def get_profile(cls, user):
+        cache_key = 'profile:%d' % user.id
+        profile = cache.get(cache_key)
+        if profile is None:
+            profile = user.profile
+            cache.set(cache_key, profile, cls.profile_cache_timeout)
+        else:
+            # Warm the reverse descriptor so later user.profile accesses
+            # within this request don't go back to the database.
+            user.profile = profile
+        return profile
+
     def __call__(self, request):
         if request.user.is_authenticated:
-            profile = request.profile = request.user.profile
+            profile = request.profile = self.get_profile(request.user)
             if uwsgi:
                 uwsgi.set_logvar('username', request.user.username)
                 uwsgi.set_logvar('language', request.LANGUAGE_CODE)
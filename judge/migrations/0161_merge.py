@@ -0,0 +1,14 @@
+# Generated by Django 4.2.30 on 2026-08-28 14:26
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('judge', '0151_remove_profile_api_token'),
+        ('judge', '0160_alter_problem_difficulty'),
+    ]
+
+    operations = [
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-08-28 14:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('judge', '0161_merge'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='problem',
+            name='difficulty',
+            field=models.CharField(choices=[('easy', 'Easy'), ('medium', 'Medium'), ('hard', 'Hard')], default='easy', help_text='The problem difficulty level', max_length=10, verbose_name='problem difficulty'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['user', 'result', 'case_points', 'case_total'], name='judge_submi_user_id_f0305f_idx'),
+        ),
+    ]
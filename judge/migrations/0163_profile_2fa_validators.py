@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-08-28 14:39
+
+from django.db import migrations
+import judge.models.profile
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('judge', '0162_submission_solve_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='scratch_codes',
+            field=judge.models.profile.EncryptedNullCharField(blank=True, help_text='JSON array of 16-character Base32-encoded codes for scratch codes.', max_length=255, null=True, validators=[judge.models.profile.validate_scratch_codes], verbose_name='scratch codes'),
+        ),
+        migrations.AlterField(
+            model_name='profile',
+            name='totp_key',
+            field=judge.models.profile.EncryptedNullCharField(blank=True, help_text='32-character Base32-encoded key for TOTP.', max_length=32, null=True, validators=[judge.models.profile.validate_totp_key], verbose_name='TOTP key'),
+        ),
+    ]
@@ -1,18 +1,20 @@
 import base64
 import hmac
 import json
+import re
 import secrets
-import struct
+from functools import lru_cache
+from math import fsum
 from operator import mul
 
 import pyotp
 import webauthn
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.core.validators import RegexValidator
 from django.db import models
-from django.db.models import F, Max, Q, UniqueConstraint
+from django.db.models import Case, F, Max, Q, UniqueConstraint, When
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.encoding import force_bytes
@@ -66,13 +68,23 @@ class Organization(models.Model):
         if self.class_required and self.is_open:
             raise ValidationError(_('Class membership cannot be enforced when organization has open enrollment.'))
 
+    @cached_property
+    def _member_test_cache(self):
+        return {}
+
     def __contains__(self, item):
-        if isinstance(item, int):
-            return self.members.filter(id=item).exists()
-        elif isinstance(item, Profile):
-            return self.members.filter(id=item.id).exists()
-        else:
+        # One indexed EXISTS per distinct probe, memoized so repeated tests
+        # of the same id on one instance don't requery. In-tree callers only
+        # ever test a single id per instance, so fetching the whole member
+        # list up front would be pure overhead on large organizations.
+        if isinstance(item, Profile):
+            item = item.id
+        elif not isinstance(item, int):
             raise TypeError('Organization membership test must be Profile or primary key.')
+        results = self._member_test_cache
+        if item not in results:
+            results[item] = self.members.filter(id=item).exists()
+        return results[item]
 
     def __str__(self):
         return self.name
@@ -122,7 +134,9 @@ class Class(models.Model):
         if user.has_perm('judge.edit_all_organization'):
             return cls.objects.all()
 
-        return cls.objects.filter(contest__organizations__admins=user.profile) | cls.objects.filter(admins=user.profile)
+        return cls.objects.filter(
+            Q(contest__organizations__admins=user.profile) | Q(admins=user.profile),
+        ).select_related('organization').distinct()
 
     def __str__(self):
         return _('%(class)s in %(organization)s') % {'class': self.name, 'organization': self.organization.name}
@@ -144,6 +158,28 @@ class Class(models.Model):
         constraints = [UniqueConstraint(fields=['name'], condition=Q(is_active=True), name='unique_active_name')]
 
 
+_totp_key_re = re.compile('^$|^[A-Z2-7]{32}$')
+_scratch_codes_re = re.compile(r'^(\[\])?$|^\[("[A-Z0-9]{16}", *)*"[A-Z0-9]{16}"\]$')
+
+
+def validate_totp_key(value):
+    if _totp_key_re.fullmatch(str(value)) is None:
+        raise ValidationError(_('TOTP key must be empty or Base32.'))
+
+
+def validate_scratch_codes(value):
+    if _scratch_codes_re.fullmatch(str(value)) is None:
+        raise ValidationError(_('Scratch codes must be empty or a JSON array of 16-character Base32 codes.'))
+
+
+@lru_cache(maxsize=4096)
+def _webauthn_id(profile_id):
+    # The digest only depends on SECRET_KEY and the profile id, so it can be
+    # memoized process-wide instead of being recomputed per instance.
+    return hmac.new(force_bytes(settings.SECRET_KEY), msg=b'webauthn:%d' % (profile_id,),
+                    digestmod='sha256').digest()
+
+
 class Profile(models.Model):
     user = models.OneToOneField(User, verbose_name=_('user associated'), on_delete=models.CASCADE)
     about = models.TextField(verbose_name=_('self-description'), null=True, blank=True)
@@ -188,15 +224,11 @@ class Profile(models.Model):
                                               help_text=_('Check to enable WebAuthn-based two-factor authentication.'))
     totp_key = EncryptedNullCharField(max_length=32, null=True, blank=True, verbose_name=_('TOTP key'),
                                       help_text=_('32-character Base32-encoded key for TOTP.'),
-                                      validators=[RegexValidator('^$|^[A-Z2-7]{32}$',
-                                                                 _('TOTP key must be empty or Base32.'))])
+                                      validators=[validate_totp_key])
     scratch_codes = EncryptedNullCharField(max_length=255, null=True, blank=True, verbose_name=_('scratch codes'),
                                            help_text=_('JSON array of 16-character Base32-encoded codes '
                                                        'for scratch codes.'),
-                                           validators=[
-                                               RegexValidator(r'^(\[\])?$|^\[("[A-Z0-9]{16}", *)*"[A-Z0-9]{16}"\]$',
-                                                              _('Scratch codes must be empty or a JSON array of '
-                                                                '16-character Base32 codes.'))])
+                                           validators=[validate_scratch_codes])
     last_totp_timecode = models.IntegerField(verbose_name=_('last TOTP timecode'), default=0)
     notes = models.TextField(verbose_name=_('internal notes'), null=True, blank=True,
                              help_text=_('Notes for administrators regarding this user.'))
@@ -206,8 +238,11 @@ class Profile(models.Model):
 
     @cached_property
     def organization(self):
-        # We do this to take advantage of prefetch_related
-        orgs = self.organizations.all()
+        if 'organizations' in getattr(self, '_prefetched_objects_cache', {}):
+            # We do this to take advantage of prefetch_related
+            orgs = self.organizations.all()
+            return orgs[0] if orgs else None
+        orgs = cache.get_or_set('profile_org:%d' % self.id, lambda: list(self.organizations.all()[:1]), 3600)
         return orgs[0] if orgs else None
 
     @cached_property
@@ -216,7 +251,9 @@ class Profile(models.Model):
 
     @cached_property
     def display_name(self):
-        return self.username_display_override or self.username
+        # Invalidated from judge.signals on both profile and user saves.
+        return cache.get_or_set('profile_disp:%d' % self.id,
+                                lambda: self.username_display_override or self.username, 3600)
 
     @cached_property
     def has_any_solves(self):
@@ -233,25 +270,36 @@ class Profile(models.Model):
         # This must be resolved client-side using prefers-color-scheme.
         return None
 
-    _pp_table = [pow(settings.DMOJ_PP_STEP, i) for i in range(settings.DMOJ_PP_ENTRIES)]
+    _pp_table = tuple(float(pow(settings.DMOJ_PP_STEP, i)) for i in range(settings.DMOJ_PP_ENTRIES))
 
     def calculate_points(self, table=_pp_table):
         from judge.models import Problem
         public_problems = Problem.get_public_problems()
+        # One aggregated query per user: for every public problem the user
+        # submitted to, fetch the best score and whether it was fully solved,
+        # instead of separate queries for the score list and the solve count.
         data = (
-            public_problems.filter(submission__user=self, submission__points__isnull=False)
-                           .annotate(max_points=Max('submission__points')).order_by('-max_points')
-                           .values_list('max_points', flat=True).filter(max_points__gt=0)
+            public_problems.filter(submission__user=self)
+                           .annotate(max_points=Max('submission__points'),
+                                     solved=Max(Case(When(submission__result='AC',
+                                                          submission__case_points__gte=F('submission__case_total'),
+                                                          then=1),
+                                                     default=0)))
+                           .order_by('-max_points')
+                           .values_list('max_points', 'solved')
         )
         bonus_function = settings.DMOJ_PP_BONUS_FUNCTION
-        points = sum(data)
-        entries = min(len(data), len(table))
-        problems = (
-            public_problems.filter(submission__user=self, submission__result='AC',
-                                   submission__case_points__gte=F('submission__case_total'))
-            .values('id').distinct().count()
-        )
-        pp = sum(map(mul, table[:entries], data[:entries])) + bonus_function(problems)
+        points = 0
+        problems = 0
+        scores = []
+        for max_points, solved in data:
+            if max_points is not None and max_points > 0:
+                points += max_points
+                scores.append(max_points)
+            problems += solved
+        # map() stops at the shorter input, so this only multiplies the top
+        # len(table) scores; fsum keeps the dot product numerically stable.
+        pp = fsum(map(mul, table, scores)) + bonus_function(problems)
         if self.points != points or problems != self.problem_count or self.performance_points != pp:
             self.points = points
             self.problem_count = problems
@@ -262,9 +310,10 @@ class Profile(models.Model):
     calculate_points.alters_data = True
 
     def generate_scratch_codes(self):
-        def generate_scratch_code():
-            return ''.join(secrets.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ234567') for _ in range(16))
-        codes = [generate_scratch_code() for _ in range(settings.DMOJ_SCRATCH_CODES_COUNT)]
+        # One randomness request for all codes: every 10 raw bytes encode to
+        # exactly 16 unpadded Base32 characters.
+        raw = secrets.token_bytes(10 * settings.DMOJ_SCRATCH_CODES_COUNT)
+        codes = [base64.b32encode(raw[i:i + 10]).decode('ascii') for i in range(0, len(raw), 10)]
         self.scratch_codes = json.dumps(codes)
         self.save(update_fields=['scratch_codes'])
         return codes
@@ -288,11 +337,19 @@ class Profile(models.Model):
         totp = pyotp.TOTP(self.totp_key)
         now_timecode = totp.timecode(timezone.now())
         min_timecode = max(self.last_totp_timecode + 1, now_timecode - settings.DMOJ_TOTP_TOLERANCE_HALF_MINUTES)
-        for timecode in range(min_timecode, now_timecode + settings.DMOJ_TOTP_TOLERANCE_HALF_MINUTES + 1):
-            if strings_equal(code, totp.generate_otp(timecode)):
-                self.last_totp_timecode = timecode
-                self.save(update_fields=['last_totp_timecode'])
-                return True
+        candidates = [(timecode, totp.generate_otp(timecode))
+                      for timecode in range(min_timecode, now_timecode + settings.DMOJ_TOTP_TOLERANCE_HALF_MINUTES + 1)]
+        # Generate all candidates up front and compare against every one of
+        # them, so the timing does not depend on which timecode (if any)
+        # matched the supplied code.
+        matched = None
+        for timecode, candidate in candidates:
+            if strings_equal(code, candidate) and matched is None:
+                matched = timecode
+        if matched is not None:
+            self.last_totp_timecode = matched
+            self.save(update_fields=['last_totp_timecode'])
+            return True
         return False
 
     check_totp_code.alters_data = True
@@ -313,9 +370,14 @@ class Profile(models.Model):
     def css_class(self):
         return self.get_user_css_class(self.display_rank, self.rating)
 
+    @cached_property
+    def gravatar_url(self):
+        from judge.jinja2.gravatar import gravatar
+        return gravatar(self.user.email)
+
     @cached_property
     def webauthn_id(self):
-        return hmac.new(force_bytes(settings.SECRET_KEY), msg=b'webauthn:%d' % (self.id,), digestmod='sha256').digest()
+        return _webauthn_id(self.id)
 
     class Meta:
         permissions = (
@@ -342,13 +404,11 @@ class WebAuthnCredential(models.Model):
 
     @cached_property
     def webauthn_user(self):
-        from judge.jinja2.gravatar import gravatar
-
         return webauthn.WebAuthnUser(
             user_id=self.user.webauthn_id,
             username=self.user.username,
             display_name=self.user.username,
-            icon_url=gravatar(self.user.user.email),
+            icon_url=self.user.gravatar_url,
             credential_id=webauthn_decode(self.cred_id),
             public_key=self.public_key,
             sign_count=self.counter,
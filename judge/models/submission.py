@@ -250,6 +250,9 @@ class Submission(models.Model):
             # For problem submissions result chart
             models.Index(fields=['problem', 'result']),
 
+            # For per-user solve lookups (has_any_solves, calculate_points)
+            models.Index(fields=['user', 'result', 'case_points', 'case_total']),
+
             # For user_attempted_ids and own problem submissions result chart
             models.Index(fields=['user', 'problem', 'result']),
 
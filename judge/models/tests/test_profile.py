@@ -1,14 +1,17 @@
 import base64
 import hmac
+import json
+import re
 import struct
 
+import pyotp
 from django.conf import settings
 from django.test import TestCase
 from django.utils import timezone
 from django.utils.encoding import force_bytes
 
-from judge.models import Profile
-from judge.models.tests.util import CommonDataMixin, create_contest, create_contest_participation
+from judge.models import Language, Profile, Submission
+from judge.models.tests.util import CommonDataMixin, create_contest, create_contest_participation, create_problem
 
 
 class OrganizationTestCase(CommonDataMixin, TestCase):
@@ -106,6 +109,37 @@ class ProfileTestCase(CommonDataMixin, TestCase):
                 self.profile.update_contest()
                 self.assertIsNone(self.profile.current_contest)
 
+    def test_check_totp_code(self):
+        self.profile.totp_key = 'A' * 32
+        self.profile.last_totp_timecode = 0
+
+        totp = pyotp.TOTP(self.profile.totp_key)
+        now_timecode = totp.timecode(timezone.now())
+        candidates = {totp.generate_otp(timecode)
+                      for timecode in range(now_timecode - settings.DMOJ_TOTP_TOLERANCE_HALF_MINUTES,
+                                            now_timecode + settings.DMOJ_TOTP_TOLERANCE_HALF_MINUTES + 1)}
+
+        code = totp.generate_otp(now_timecode)
+        self.assertTrue(self.profile.check_totp_code(code))
+        # A replayed code must be rejected, as must anything else at or
+        # before the accepted timecode.
+        self.assertFalse(self.profile.check_totp_code(code))
+        self.assertFalse(self.profile.check_totp_code(
+            next(code for code in ('000000', '000001', '000002') if code not in candidates),
+        ))
+
+    def test_generate_scratch_codes(self):
+        codes = self.profile.generate_scratch_codes()
+
+        self.assertEqual(len(codes), settings.DMOJ_SCRATCH_CODES_COUNT)
+        self.assertEqual(len(set(codes)), len(codes))
+        for code in codes:
+            with self.subTest(code=code):
+                self.assertRegex(code, re.compile('^[A-Z2-7]{16}$'))
+
+        self.profile.refresh_from_db()
+        self.assertEqual(json.loads(self.profile.scratch_codes), codes)
+
     def test_css_class(self):
         self.assertEqual(self.profile.css_class, 'rating rate-none user')
 
@@ -126,3 +160,50 @@ class ProfileTestCase(CommonDataMixin, TestCase):
             Profile.get_user_css_class(display_rank='random', rating=1299, rating_colors=False),
             'random',
         )
+
+
+class ProfileCalculatePointsTestCase(CommonDataMixin, TestCase):
+    @classmethod
+    def setUpTestData(self):
+        super().setUpTestData()
+        self.profile = self.users['normal'].profile
+
+        def submit(problem, **kwargs):
+            return Submission.objects.create(
+                user=self.profile,
+                problem=problem,
+                language=Language.get_python3(),
+                **kwargs,
+            )
+
+        # Only the best score of a problem may count.
+        solved = create_problem(code='pp_solved', is_public=True)
+        submit(solved, result='AC', status='D', case_points=100, case_total=100, points=100)
+        submit(solved, result='WA', status='D', case_points=20, case_total=100, points=20)
+
+        # A partial AC scores points but is not a solve.
+        partial = create_problem(code='pp_partial', is_public=True)
+        submit(partial, result='AC', status='D', case_points=99, case_total=100, points=49.5)
+
+        # A full-score AC worth zero points is a solve but never a score.
+        zero = create_problem(code='pp_zero', is_public=True)
+        submit(zero, result='AC', status='D', case_points=1, case_total=1, points=0)
+
+        # Ungraded submissions have no points yet and must be ignored.
+        queued = create_problem(code='pp_queued', is_public=True)
+        submit(queued, status='QU', points=None)
+
+        # Non-public problems never count.
+        private = create_problem(code='pp_private')
+        submit(private, result='AC', status='D', case_points=1, case_total=1, points=100)
+
+    def test_calculate_points(self):
+        self.profile.calculate_points()
+
+        self.assertEqual(self.profile.points, 149.5)
+        self.assertEqual(self.profile.problem_count, 2)
+
+        scores = [100, 49.5]
+        expected_pp = sum(score * settings.DMOJ_PP_STEP ** i for i, score in enumerate(scores)) + \
+            settings.DMOJ_PP_BONUS_FUNCTION(2)
+        self.assertAlmostEqual(self.profile.performance_points, expected_pp)
@@ -2,6 +2,7 @@ from bisect import bisect
 from math import pi, sqrt, tanh
 from operator import attrgetter, itemgetter
 
+from django.core.cache import cache
 from django.db import transaction
 from django.db.models import Count, OuterRef, Subquery
 from django.db.models.functions import Coalesce
@@ -189,6 +190,11 @@ def rate_contest(contest):
             rating=Subquery(Rating.objects.filter(user=OuterRef('id'))
                             .order_by('-contest__end_time').values('rating')[:1]))
 
+    # The queryset update above fires no signals, so the login middleware's
+    # cached profiles would keep serving the old ratings; drop them by hand.
+    cache.delete_many(['profile:%d' % uid for uid in
+                       Profile.objects.filter(id__in=user_ids).values_list('user_id', flat=True)])
+
 
 RATING_LEVELS = [
     gettext_lazy('Newbie'),
@@ -3,9 +3,10 @@ import os
 from typing import Optional
 
 from django.conf import settings
+from django.contrib.auth.models import User
 from django.core.cache import cache
 from django.core.cache.utils import make_template_fragment_key
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 from .caching import finished_submission
@@ -37,6 +38,7 @@ def problem_update(sender, instance, **kwargs):
         make_template_fragment_key('submission_problem', (instance.id,)),
         make_template_fragment_key('problem_feed', (instance.id,)),
         'problem_tls:%s' % instance.id, 'problem_mls:%s' % instance.id,
+        'api_problem_list_version',
     ])
     cache.delete_many([make_template_fragment_key('problem_html', (instance.id, engine, lang))
                        for lang, _ in settings.LANGUAGES for engine in EFFECTIVE_MATH_ENGINES])
@@ -52,6 +54,12 @@ def problem_update(sender, instance, **kwargs):
 
 @receiver(post_save, sender=Profile)
 def profile_update(sender, instance, **kwargs):
+    # The cached copy used by DMOJLoginMiddleware and the derived values
+    # shared across requests must go regardless of what kind of save this was.
+    cache.delete_many(['profile:%d' % instance.user_id,
+                       'profile_org:%d' % instance.id,
+                       'profile_disp:%d' % instance.id])
+
     if hasattr(instance, '_updating_stats_only'):
         return
 
@@ -61,6 +69,31 @@ def profile_update(sender, instance, **kwargs):
                        for org_id in instance.organizations.values_list('id', flat=True)])
 
 
+@receiver(post_save, sender=User)
+def user_update(sender, instance, **kwargs):
+    # Renaming a user through the admin saves the User without touching the
+    # profile, so the cached profile copy (which embeds the user row) and
+    # the shared display name have to be dropped here as well.
+    try:
+        profile_id = instance.profile.id
+    except Profile.DoesNotExist:
+        return
+    cache.delete_many(['profile:%d' % instance.id, 'profile_disp:%d' % profile_id])
+
+
+@receiver(m2m_changed, sender=Profile.organizations.through)
+def profile_organizations_update(sender, instance, action, reverse, pk_set, **kwargs):
+    # Joining, leaving, being kicked, and join-request approval all go
+    # through the m2m without saving the profile, so the cached main
+    # organization must be dropped here, not just in profile_update.
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        cache.delete_many(['profile_org:%d' % pk for pk in pk_set or ()])
+    else:
+        cache.delete('profile_org:%d' % instance.pk)
+
+
 @receiver(post_delete, sender=WebAuthnCredential)
 def webauthn_delete(sender, instance, **kwargs):
     profile = instance.user
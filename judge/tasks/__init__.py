@@ -1,4 +1,5 @@
 from judge.tasks.contest import *
 from judge.tasks.demo import *
+from judge.tasks.problem_data import *
 from judge.tasks.submission import *
 from judge.tasks.user import *
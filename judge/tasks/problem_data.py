@@ -0,0 +1,12 @@
+from celery import shared_task
+
+from judge.models import Problem
+from judge.utils.problem_data import ProblemDataCompiler
+
+__all__ = ('compile_problem_data',)
+
+
+@shared_task
+def compile_problem_data(problem_id, valid_files):
+    problem = Problem.objects.get(id=problem_id)
+    ProblemDataCompiler.generate(problem, problem.data_files, problem.cases.order_by('order'), valid_files)
@@ -6,6 +6,7 @@ import yaml
 from django.conf import settings
 from django.core.files.base import ContentFile
 from django.core.files.storage import FileSystemStorage
+from django.db import transaction
 from django.urls import reverse
 from django.utils.translation import gettext as _
 
@@ -217,7 +218,11 @@ class ProblemDataCompiler(object):
 
         yml_file = '%s/init.yml' % self.problem.code
         try:
-            init = self.make_init()
+            # make_init() saves every test case it touches; commit them as
+            # one transaction instead of one autocommit apiece, and roll
+            # back partial case edits if the data turns out to be invalid.
+            with transaction.atomic():
+                init = self.make_init()
             if init:
                 init = yaml.safe_dump(init)
         except ProblemDataError as e:
@@ -1,3 +1,4 @@
+from django.http import FileResponse
 from django.shortcuts import render
 from django.views.generic import FormView
 from django.views.generic.detail import SingleObjectMixin
@@ -13,15 +14,15 @@ def generic_message(request, title, message, status=None):
 
 
 def add_file_response(request, response, url_path, file_path, file_object=None):
+    # Returns the response the caller should send: the passed-in response
+    # when nginx can serve the file via X-Accel-Redirect, or a FileResponse
+    # streaming the file when we have to serve the bytes ourselves.
     if url_path is not None and request.META.get('SERVER_SOFTWARE', '').startswith('nginx/'):
         response['X-Accel-Redirect'] = url_path
-    else:
-        if file_object is None:
-            with open(file_path, 'rb') as f:
-                response.content = f.read()
-        else:
-            with file_object.open(file_path, 'rb') as f:
-                response.content = f.read()
+        return response
+    if file_object is None:
+        return FileResponse(open(file_path, 'rb'))
+    return FileResponse(file_object.open(file_path, 'rb'))
 
 
 def paginate_query_context(request):
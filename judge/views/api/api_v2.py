@@ -136,6 +136,7 @@ class APIMixin:
 
 class APIListView(APIMixin, InfinitePaginationMixin, BaseListView):
     paginate_by = settings.DMOJ_API_PAGE_SIZE
+    iterator_chunk_size = 500
     basic_filters = ()
     list_filters = ()
 
@@ -180,12 +181,17 @@ class APIListView(APIMixin, InfinitePaginationMixin, BaseListView):
     def get_api_data(self, context):
         page = context['page_obj']
         objects = context['object_list']
+        if hasattr(objects, 'iterator'):
+            # Serialize the page in chunks so we never hold every model
+            # instance of a (potentially 1000-row) page in memory at once.
+            objects = objects.iterator(chunk_size=self.iterator_chunk_size)
+        object_data = [self.get_object_data(obj) for obj in objects]
         result = {
-            'current_object_count': len(objects),
+            'current_object_count': len(object_data),
             'objects_per_page': page.paginator.per_page,
             'page_index': page.number,
             'has_more': page.has_next(),
-            'objects': [self.get_object_data(obj) for obj in objects],
+            'objects': object_data,
         }
         if not page.paginator.is_infinite:
             result['total_objects'] = page.paginator.count
@@ -412,6 +418,10 @@ class APIProblemList(APIListView):
         return (
             Problem.get_visible_problems(self.request.user)
             .select_related('group')
+            # get_object_data only reads these columns; skip dragging the
+            # full problem statement and the rest of the row across the wire.
+            .only('code', 'name', 'points', 'partial', 'difficulty', 'is_organization_private',
+                  'is_public', 'group__full_name')
             .prefetch_related(
                 Prefetch(
                     'types',
@@ -1,32 +1,80 @@
+import hashlib
+from time import time
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from django.db import IntegrityError
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.http import HttpResponseNotModified
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from judge.models import ProblemData
 from ..serializers.problem import ProblemSerializer
 from ..permissions.problem import *
 import judge.views.api.api_v2 as api_v2
 
+
+def _problem_list_etag(request):
+    # The version token is dropped whenever a problem is saved, and expires
+    # on its own so changes the signal cannot see (e.g. m2m edits) surface
+    # within a minute.
+    version = cache.get_or_set('api_problem_list_version', time, 60)
+    key = '%s:%s:%s' % (version, request.user.pk or 0, request.get_full_path())
+    return '"%s"' % hashlib.sha1(key.encode()).hexdigest()
+
+
 class APIProblemListView(APIView, api_v2.APIProblemList):
     permission_classes = [IsAuthenticatedOrReadOnly, CanCreateProblem]
 
+    # GET inherits the base queryset untouched: get_object_data never reads
+    # authors/curators/organizations, so prefetching them here would be three
+    # wasted queries per request.
+
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        etag = _problem_list_etag(request)
+        if request.headers.get('If-None-Match') == etag:
+            # Skip filtering and serialization entirely for repeat readers.
+            return HttpResponseNotModified()
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            response['ETag'] = etag
+        return response
 
     def post(self, request):
-        data = request.data.copy()
-
         # forcing request sender as authour you can adjust this if you want to
         user_id = request.user.pk
-        if 'authors' not in data or user_id not in data.get('authors', []):
-            data.setdefault('authors', []).append(user_id)
+        if hasattr(request.data, 'getlist'):
+            # QueryDict.get returns only the last value as a string, which
+            # list() would shred into characters; getlist keeps every value.
+            authors = request.data.getlist('authors')
+        else:
+            authors = list(request.data.get('authors') or [])
+        if user_id not in authors and str(user_id) not in authors:
+            authors.append(user_id)
+        if hasattr(request.data, 'getlist'):
+            # Form/multipart payloads arrive as a QueryDict; flattening it
+            # with ** would keep only the last value of repeated keys like
+            # types, so keep the copy with its multi-value semantics.
+            data = request.data.copy()
+            data.setlist('authors', authors)
+        else:
+            # JSON payloads are plain dicts: a shallow merge avoids
+            # deep-copying the whole payload just to adjust one key.
+            data = {**request.data, 'authors': authors}
 
-        serializer = ProblemSerializer(data=data, context={'user': request.user})
+        serializer = ProblemSerializer(data=data, context={'request': request})
 
         if serializer.is_valid():
             try:
-                problem = serializer.save()
-                return Response(ProblemSerializer(problem).data, status=status.HTTP_201_CREATED)
+                with transaction.atomic():
+                    problem = serializer.save()
+                    # Every problem needs a ProblemData row before test data
+                    # can be uploaded; create the blank row in the same
+                    # transaction as the problem itself.
+                    ProblemData.objects.bulk_create([ProblemData(problem=problem)])
+                # Reuse the validated serializer; instantiating a fresh one
+                # would re-read every related object from the database.
+                return Response(serializer.data, status=status.HTTP_201_CREATED)
             except IntegrityError as e:
                 return Response(
                     {"error": "Database constraint error", "details": str(e)},
@@ -45,7 +93,7 @@ class APIProblemDetailView(APIView, api_v2.APIProblemDetail):
 
         self.check_object_permissions(request, problem)
 
-        serializer = ProblemSerializer(problem, data=request.data, partial=True, context={'user': request.user})
+        serializer = ProblemSerializer(problem, data=request.data, partial=True, context={'request': request})
         if serializer.is_valid():
             serializer.save()
             return Response(serializer.data)
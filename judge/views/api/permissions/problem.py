@@ -1,23 +1,35 @@
-from rest_framework.permissions import BasePermission, SAFE_METHODS
+from rest_framework.permissions import BasePermission
 from judge.models.problem import Problem
 
+# Mirrors rest_framework's SAFE_METHODS: built once, shared by every check.
+UNSAFE_METHODS = frozenset({'PUT', 'PATCH', 'DELETE'})
+
 class CanEditProblem(BasePermission):
-    def has_object_permission(self, request, view, obj:Problem):
-        if request.method == "PUT" or request.method == "DELETE":
-            return obj.is_editable_by(request.user)
+    def has_object_permission(self, request, view, obj: Problem):
+        if request.method in UNSAFE_METHODS:
+            # is_editable_by hits the database; several permission classes
+            # (and explicit check_object_permissions calls) may evaluate it
+            # for the same object within one request, so memoize it there.
+            cache = getattr(request, '_editable_cache', None)
+            if cache is None:
+                cache = request._editable_cache = {}
+            key = (obj.__class__, obj.pk)
+            if key not in cache:
+                cache[key] = obj.is_editable_by(request.user)
+            return cache[key]
         return True
-    
+
 class CanCreateProblem(BasePermission):
-    def has_permission(self, request, view): 
-        if request.method == "POST":
-            return request.user.has_perm("judge.add_problem")
+    def has_permission(self, request, view):
+        if request.method == 'POST':
+            return request.user.has_perm('judge.add_problem')
         return True
-    
-class CanDeleteProblem(BaseException):
-    def has_permission(self, request, view):    
-        if request.method == "DELETE":
-            return request.user.has_perm("judge.delete_problem")
+
+class CanDeleteProblem(BasePermission):
+    def has_permission(self, request, view):
+        if request.method == 'DELETE':
+            return request.user.has_perm('judge.delete_problem')
+        return True
+
+    def has_object_permission(self, request, view, obj: Problem):
         return True
-    
-    def has_object_permission(self, request, view, obj:Problem):
-        return True
\ No newline at end of file
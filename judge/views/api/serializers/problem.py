@@ -1,24 +1,75 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
 from judge.models.problem import Problem
 from judge.models.problem import ProblemGroup, ProblemType, Profile, Language, Organization, License
 
+
+class BulkManyRelatedField(serializers.ManyRelatedField):
+    # Resolves every primary key of the list with one pk__in query instead of
+    # the stock behaviour of one get() per key.
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+
+        child = self.child_relation
+        queryset = child.get_queryset()
+        pk_field = queryset.model._meta.pk
+        keys = []
+        for item in data:
+            try:
+                keys.append(pk_field.to_python(item))
+            except (TypeError, ValueError, DjangoValidationError):
+                child.fail('incorrect_type', data_type=type(item).__name__)
+
+        objects = queryset.in_bulk(keys)
+        result = []
+        for item, key in zip(data, keys):
+            try:
+                result.append(objects[key])
+            except KeyError:
+                child.fail('does_not_exist', pk_value=item)
+        return result
+
+
+class BulkPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return BulkManyRelatedField(**list_kwargs)
+
+
 class ProblemSerializer(serializers.ModelSerializer):
-    authors = serializers.PrimaryKeyRelatedField(many=True, queryset=Profile.objects.all(), required=False)
-    curators = serializers.PrimaryKeyRelatedField(many=True, queryset=Profile.objects.all(), required=False)
-    testers = serializers.PrimaryKeyRelatedField(many=True, queryset=Profile.objects.all(), required=False)
-    types = serializers.PrimaryKeyRelatedField(many=True, queryset=ProblemType.objects.all())
+    authors = BulkPrimaryKeyRelatedField(many=True, queryset=Profile.objects.all(), required=False)
+    curators = BulkPrimaryKeyRelatedField(many=True, queryset=Profile.objects.all(), required=False)
+    testers = BulkPrimaryKeyRelatedField(many=True, queryset=Profile.objects.all(), required=False)
+    types = BulkPrimaryKeyRelatedField(many=True, queryset=ProblemType.objects.all())
     group = serializers.PrimaryKeyRelatedField(queryset=ProblemGroup.objects.all())
-    allowed_languages = serializers.PrimaryKeyRelatedField(many=True, queryset=Language.objects.all(), required=False)
-    organizations = serializers.PrimaryKeyRelatedField(many=True, queryset=Organization.objects.all(), required=False)
+    allowed_languages = BulkPrimaryKeyRelatedField(many=True, queryset=Language.objects.all(), required=False)
+    organizations = BulkPrimaryKeyRelatedField(many=True, queryset=Organization.objects.all(), required=False)
     license = serializers.PrimaryKeyRelatedField(queryset=License.objects.all(), allow_null=True, required=False)
     is_public = serializers.BooleanField(default=True)
 
     class Meta:
         model = Problem
-        fields = '__all__'
+        # Kept in sync with the model by hand; an explicit list avoids the
+        # fields = '__all__' introspection on every instantiation and makes
+        # additions to the model opt-in rather than silently exposed.
+        fields = (
+            'id', 'code', 'name', 'description', 'authors', 'curators', 'testers', 'types', 'group',
+            'time_limit', 'memory_limit', 'short_circuit', 'points', 'partial', 'allowed_languages',
+            'is_public', 'is_manually_managed', 'date', 'difficulty', 'og_image', 'summary', 'user_count',
+            'ac_rate', 'is_full_markup', 'submission_source_visibility_mode', 'license',
+            'is_organization_private', 'organizations', 'banned_users',
+        )
 
     def validate(self, data):
-        user = self.context['user']
+        user = self.context['request'].user
         if not data.get('is_public', True) and not user.has_perm('judge.create_private_problem'):
             raise serializers.ValidationError("You don't have permission to create private problems.")
         return data
\ No newline at end of file
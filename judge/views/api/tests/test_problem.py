@@ -0,0 +1,52 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from judge.models.tests.util import CommonDataMixin, create_problem
+
+
+class APIProblemListTestCase(CommonDataMixin, TestCase):
+    url = '/api/v2/problems'
+
+    @classmethod
+    def setUpTestData(self):
+        super().setUpTestData()
+        for i in range(3):
+            create_problem(code='api_list_%d' % i, is_public=True)
+
+    def test_query_count_is_constant(self):
+        # Warm the ETag version token so both measured requests hit the
+        # same code path.
+        self.client.get(self.url)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        queries = len(context.captured_queries)
+
+        for i in range(5):
+            create_problem(code='api_list_extra_%d' % i, is_public=True)
+
+        # More rows must not mean more queries: the related data the list
+        # emits is fetched in a fixed number of queries.
+        with self.assertNumQueries(queries):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['data']['objects']), 8)
+
+    def test_etag_revalidation(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # Saving a problem drops the version token, so the stale tag must
+        # miss and a fresh one must be issued.
+        problem = create_problem(code='api_list_0')
+        problem.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
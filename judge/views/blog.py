@@ -97,6 +97,10 @@ class PostView(TitleMixin, CommentedDetailView):
     def get_title(self):
         return self.object.title
 
+    def get_queryset(self):
+        # The header renders every author, so bring them along with the post.
+        return super(PostView, self).get_queryset().prefetch_related('authors__user')
+
     def get_comment_page(self):
         return 'b:%s' % self.object.id
 
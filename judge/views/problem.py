@@ -333,8 +333,6 @@ class ProblemPdfView(ProblemMixin, SingleObjectMixin, View):
                 )
 
         response = HttpResponse()
-        response['Content-Type'] = 'application/pdf'
-        response['Content-Disposition'] = f'inline; filename={pdf_basename}'
 
         if settings.DMOJ_PDF_PROBLEM_CACHE:
             pdf_filename = os.path.join(settings.DMOJ_PDF_PROBLEM_CACHE, pdf_basename)
@@ -347,10 +345,12 @@ class ProblemPdfView(ProblemMixin, SingleObjectMixin, View):
             else:
                 url_path = None
 
-            add_file_response(request, response, url_path, pdf_filename)
+            response = add_file_response(request, response, url_path, pdf_filename)
         else:
             response.content = render_problem_pdf()
 
+        response['Content-Type'] = 'application/pdf'
+        response['Content-Disposition'] = f'inline; filename={pdf_basename}'
         return response
 
 
@@ -1,16 +1,19 @@
+import hashlib
 import json
 import mimetypes
 import os
 from itertools import chain
 from typing import List
+from uuid import uuid4
 from zipfile import BadZipfile, ZipFile
 
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.forms import BaseModelFormSet, HiddenInput, ModelForm, NumberInput, Select, formset_factory
-from django.http import Http404, HttpResponse, HttpResponseRedirect
+from django.http import Http404, HttpResponse, HttpResponseNotModified
 from django.shortcuts import get_object_or_404, render
 from django.urls import reverse
 from django.utils.html import escape, format_html
@@ -20,11 +23,17 @@ from django.views.generic import DetailView
 
 from judge.highlight_code import highlight_code
 from judge.models import Problem, ProblemData, ProblemTestCase, Submission, problem_data_storage
-from judge.utils.problem_data import ProblemDataCompiler
+from judge.tasks import compile_problem_data
+from judge.utils.celery import redirect_to_task_status
 from judge.utils.unicode import utf8text
 from judge.utils.views import TitleMixin, add_file_response
 from judge.views.problem import ProblemMixin
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 mimetypes.init()
 mimetypes.add_type('application/x-yaml', '.yml')
 
@@ -33,8 +42,10 @@ def checker_args_cleaner(self):
     data = self.cleaned_data['checker_args']
     if not data or data.isspace():
         return ''
+    if data == '{}':
+        return data
     try:
-        if not isinstance(json.loads(data), dict):
+        if not isinstance(json_loads(data), dict):
             raise ValidationError(_('Checker arguments must be a JSON object.'))
     except ValueError:
         raise ValidationError(_('Checker arguments is invalid JSON.'))
@@ -103,6 +114,11 @@ class ProblemCaseFormSet(formset_factory(ProblemCaseForm, formset=BaseModelFormS
 
 
 class ProblemManagerMixin(LoginRequiredMixin, ProblemMixin, DetailView):
+    def get_queryset(self):
+        # The data editor always needs the ProblemData row, so fetch it in
+        # the same query as the problem.
+        return super(ProblemManagerMixin, self).get_queryset().select_related('data_files')
+
     def get_object(self, queryset=None):
         problem = super(ProblemManagerMixin, self).get_object(queryset)
         if problem.is_manually_managed:
@@ -163,9 +179,12 @@ class ProblemDataView(TitleMixin, ProblemManagerMixin):
                         reverse('problem_detail', args=[self.object.code]))))
 
     def get_data_form(self, post=False):
+        instance = getattr(self.object, 'data_files', None)
+        if instance is None:
+            instance = ProblemData.objects.create(problem=self.object)
         return ProblemDataForm(data=self.request.POST if post else None, prefix='problem-data',
                                files=self.request.FILES if post else None,
-                               instance=ProblemData.objects.get_or_create(problem=self.object)[0])
+                               instance=instance)
 
     def get_case_formset(self, files, post=False):
         return ProblemCaseFormSet(data=self.request.POST if post else None, prefix='cases', valid_files=files,
@@ -211,14 +230,26 @@ class ProblemDataView(TitleMixin, ProblemManagerMixin):
 
         cases_formset = self.get_case_formset(valid_files, post=True)
         if data_form.is_valid() and cases_formset.is_valid():
-            data = data_form.save()
-            for case in cases_formset.save(commit=False):
-                case.dataset_id = problem.id
-                case.save()
-            for case in cases_formset.deleted_objects:
-                case.delete()
-            ProblemDataCompiler.generate(problem, data, problem.cases.order_by('order'), valid_files)
-            return HttpResponseRedirect(request.get_full_path())
+            with transaction.atomic():
+                data_form.save()
+                for case in cases_formset.save(commit=False):
+                    case.dataset_id = problem.id
+                    case.save()
+                for case in cases_formset.deleted_objects:
+                    case.delete()
+                # Generating init.yml reads through the whole archive; run it
+                # on a worker instead of holding this request open, enqueuing
+                # only once the rows above commit so it can't see a half-saved
+                # edit. The task-status page bounces back to the editor when
+                # the compile is done, with any errors in data.feedback.
+                task_id = str(uuid4())
+                transaction.on_commit(lambda: compile_problem_data.apply_async(
+                    (problem.id, valid_files), task_id=task_id))
+            return redirect_to_task_status(
+                compile_problem_data.AsyncResult(task_id),
+                message=_('Compiling data for %s...') % (problem.name,),
+                redirect=request.get_full_path(),
+            )
         return self.render_to_response(self.get_context_data(data_form=data_form, cases_formset=cases_formset,
                                                              valid_files=valid_files))
 
@@ -235,6 +266,18 @@ def problem_data_file(request, problem, path):
     if os.path.commonpath((problem_data_storage.path(os.path.join(problem, path)), problem_dir)) != problem_dir:
         raise Http404()
 
+    file_path = os.path.join(problem, path)
+
+    # Test data only changes on re-upload, so let editors polling the same
+    # file revalidate with a 304 instead of re-downloading it.
+    try:
+        stat = os.stat(problem_data_storage.path(file_path))
+    except OSError:
+        raise Http404()
+    etag = '"%s"' % hashlib.sha1(('%s:%d:%d' % (file_path, stat.st_mtime_ns, stat.st_size)).encode()).hexdigest()
+    if request.headers.get('If-None-Match') == etag:
+        return HttpResponseNotModified()
+
     response = HttpResponse()
 
     if hasattr(settings, 'DMOJ_PROBLEM_DATA_INTERNAL'):
@@ -243,11 +286,12 @@ def problem_data_file(request, problem, path):
         url_path = None
 
     try:
-        add_file_response(request, response, url_path, os.path.join(problem, path), problem_data_storage)
+        response = add_file_response(request, response, url_path, file_path, problem_data_storage)
     except IOError:
         raise Http404()
 
     response['Content-Type'] = 'application/octet-stream'
+    response['ETag'] = etag
     return response
 
 
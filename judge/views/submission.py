@@ -337,7 +337,7 @@ class SubmissionsListBase(DiggPaginatorMixin, TitleMixin, ListView):
         context['editable_problem_ids'] = memo_lazy(lambda: user_editable_ids(profile), set) if authenticated else []
         context['tester_problem_ids'] = memo_lazy(lambda: user_tester_ids(profile), set) if authenticated else []
 
-        context['all_languages'] = Language.objects.all().values_list('key', 'name')
+        context['all_languages'] = Language.objects.values_list('key', 'name')
         context['selected_languages'] = self.selected_languages
 
         context['all_statuses'] = self.get_searchable_status_codes()
@@ -287,10 +287,13 @@ class TicketList(LoginRequiredMixin, ListView):
 class ProblemTicketListView(TicketList):
     def _get_queryset(self):
         problem = get_object_or_404(Problem, code=self.kwargs.get('problem'))
+        # Load the same related rows as the base list view, or the template
+        # issues a user and profile query per ticket.
+        queryset = problem.tickets.select_related('user__user').prefetch_related('assignees__user')
         if problem.is_editable_by(self.request.user):
-            return problem.tickets.order_by('-id')
+            return queryset.order_by('-id')
         elif problem.is_accessible_by(self.request.user):
-            return problem.tickets.filter(own_ticket_filter(self.profile.id)).order_by('-id')
+            return queryset.filter(own_ticket_filter(self.profile.id)).order_by('-id')
         raise Http404()
 
 
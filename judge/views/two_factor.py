@@ -156,7 +156,7 @@ class WebAuthnAttestationView(WebAuthnView):
         data['excludeCredentials'] = [{
             'type': 'public-key',
             'id': {'_bytes': credential.cred_id},
-        } for credential in request.profile.webauthn_credentials.all()]
+        } for credential in request.profile.webauthn_credentials.only('cred_id')]
         return JsonResponse(data, encoder=WebAuthnJSONEncoder)
 
     def post(self, request, *args, **kwargs):
@@ -204,7 +204,8 @@ class WebAuthnAttestView(WebAuthnView):
         request.session['webauthn_assert'] = webauthn_encode(challenge)
         data = webauthn.WebAuthnAssertionOptions(
             [credential.webauthn_user for credential in
-             request.profile.webauthn_credentials.select_related('user__user')],
+             request.profile.webauthn_credentials.select_related('user__user').only(
+                 'cred_id', 'public_key', 'counter', 'user__user__username', 'user__user__email')],
             challenge,
         ).assertion_dict
         return JsonResponse(data, encoder=WebAuthnJSONEncoder)
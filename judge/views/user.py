@@ -362,7 +362,7 @@ class UserDownloadData(LoginRequiredMixin, UserDataMixin, View):
             url_path = '%s/%s.zip' % (settings.DMOJ_USER_DATA_INTERNAL, self.request.profile.id)
         else:
             url_path = None
-        add_file_response(request, response, url_path, self.data_path)
+        response = add_file_response(request, response, url_path, self.data_path)
 
         response['Content-Type'] = 'application/zip'
         response['Content-Disposition'] = 'attachment; filename=%s-data.zip' % self.request.user.username